@@ -6,19 +6,37 @@ usage data, history, and velocity via a local HTTP API.
 """
 
 import argparse
+import bisect
+import concurrent.futures
+import functools
+import heapq
+import io
 import json
 import logging
+import math
 import os
+import queue
 import signal
 import sys
 import threading
 import time
-from datetime import datetime, timedelta, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from array import array
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, urlparse
-from urllib.request import Request, urlopen
+
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 log = logging.getLogger("api-dashboard")
 
@@ -32,99 +50,320 @@ CONFIG_FILE = Path(os.environ.get(
     "XDG_CONFIG_HOME", Path.home() / ".config")) / "api-dashboard" / "config.json"
 
 CACHE_TTL = 60  # seconds
+COOKIE_CACHE_TTL = 300  # seconds
 HISTORY_MAX_DAYS = 28
+MIN_POLL_INTERVAL = 60  # seconds; floor for any configured poll interval
+HTTP_CONNECT_TIMEOUT = 5  # seconds
+HTTP_READ_TIMEOUT = 15  # seconds
+HTTP_RETRIES = 2
+# Worst case for one _http_get (every attempt uses its full timeout, plus
+# slack for retry backoff), and for one adapter: Claude makes two requests
+# back to back. A poll batch waits this long before reporting "Timed out".
+HTTP_REQUEST_BUDGET = (HTTP_RETRIES + 1) * (HTTP_CONNECT_TIMEOUT + HTTP_READ_TIMEOUT) + 5
+POLL_TIMEOUT = 2 * HTTP_REQUEST_BUDGET
+# Services on monthly quotas change slowly, so they are polled no more often
+# than this unless their config sets an explicit "interval".
+SERVICE_MIN_INTERVALS = {
+    "firecrawl": 900,
+    "serpapi": 900,
+}
 
 # ---------------------------------------------------------------------------
 # Thread-safe state
 # ---------------------------------------------------------------------------
 _lock = threading.Lock()
-_usage_cache: dict[str, dict] = {}       # service_id -> {data, timestamp}
-_history: dict[str, list[dict]] = {}     # service_id -> [{timestamp, value, ...}]
+_usage_snapshot: dict[str, dict] = {}    # service_id -> {data, timestamp}
+_history: dict[str, dict] = {}           # service_id -> {ts, val, extra} parallel arrays
+_history_dirty = False                   # unsaved samples pending in _history
+_cookie_cache: dict[tuple, tuple] = {}   # (browser, profile_path) -> (fetched_at, cookies)
+_keyring_cache: dict[str, str] = {}      # key -> secret (non-empty lookups only)
+_poll_wakeup = threading.Event()         # set to make the Poller re-read config now
 _config: dict = {
     "refresh_interval": 300,
     "services": {}
 }
 
+# _usage_snapshot and _config are copy-on-write: writers build a new dict
+# under _lock and publish it with a single assignment, so readers can grab
+# the current reference without locking. Never mutate them in place.
+
+def _publish_usage(updates: dict[str, dict]):
+    global _usage_snapshot
+    with _lock:
+        new = dict(_usage_snapshot)
+        new.update(updates)
+        _usage_snapshot = new
+
+
+def _service_configs() -> dict[str, dict]:
+    """Per-service config entries, ignoring any that aren't dicts."""
+    services = _config.get("services")
+    if not isinstance(services, dict):
+        return {}
+    return {svc_id: cfg for svc_id, cfg in services.items() if isinstance(cfg, dict)}
+
+
+def _publish_config(changes: dict) -> dict:
+    global _config
+    with _lock:
+        new = {**_config, **changes}
+        _config = new
+    return new
+
+# ---------------------------------------------------------------------------
+# JSON encoding (orjson when available, stdlib otherwise)
+# ---------------------------------------------------------------------------
+
+def _json_loads(data: bytes | str):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _json_first_item(data: bytes):
+    """Return the first element of a top-level JSON array, or None if empty.
+
+    With ijson available only that element is parsed; the rest of the
+    document is never materialized.
+    """
+    if ijson is not None:
+        try:
+            return next(ijson.items(io.BytesIO(data), "item", use_float=True), None)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+    items = _json_loads(data)
+    return items[0] if isinstance(items, list) and items else None
+
+# ---------------------------------------------------------------------------
+# Background file writer
+# ---------------------------------------------------------------------------
+_writer_q: queue.Queue = queue.Queue()   # (path, data, mode) or None to stop
+
+
+def _queue_write(path: Path, data: bytes, mode: int | None = None):
+    """Hand a whole-file write (and optional chmod) to the Writer thread."""
+    _writer_q.put((path, data, mode))
+
+
+def _write_file(path: Path, data: bytes, mode: int | None) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        if mode is not None:
+            path.chmod(mode)
+    except Exception as e:
+        log.warning("Failed to write %s: %s", path, e)
+        return False
+    return True
+
+
+class Writer(threading.Thread):
+    """Performs queued file writes off the poll and request threads.
+
+    Everything already queued is drained before writing, so repeated writes
+    to the same path collapse into one write of the newest contents.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+
+    def run(self):
+        global _history_dirty
+        stopping = False
+        while not stopping:
+            pending: dict[Path, tuple] = {}
+            item = _writer_q.get()
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    path, data, mode = item
+                    pending[path] = (data, mode)
+                try:
+                    item = _writer_q.get_nowait()
+                except queue.Empty:
+                    break
+            for path, (data, mode) in pending.items():
+                if not _write_file(path, data, mode) and path == HISTORY_FILE:
+                    # Re-arm so the poller's next _save_history() retries
+                    with _lock:
+                        _history_dirty = True
+
+    def stop(self):
+        """Flush queued writes and wait for the thread to exit."""
+        _writer_q.put(None)
+        self.join()
+
 # ---------------------------------------------------------------------------
 # History persistence
 # ---------------------------------------------------------------------------
 
-def _load_history() -> dict[str, list[dict]]:
+# Each service's history is stored as parallel arrays rather than a list of
+# dicts: "ts" holds Unix timestamps (ascending), "val" the usage percentage
+# and "extra" the optional details dict for each sample.
+def _new_series() -> dict:
+    return {"ts": array("d"), "val": array("d"), "extra": []}
+
+
+def _parse_timestamp(value: str) -> float:
+    t = datetime.fromisoformat(value.rstrip("Z"))
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return t.timestamp()
+
+
+def _format_timestamp(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds") + "Z"
+
+
+def _now_iso(now: datetime | None = None) -> str:
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return now.isoformat(timespec="seconds") + "Z"
+
+
+def _series_from_json(data: dict | list) -> dict:
+    series = _new_series()
+    if isinstance(data, list):
+        # Legacy format: list of {timestamp, value, **extra} dicts
+        for entry in data:
+            try:
+                ts = _parse_timestamp(entry.get("timestamp", ""))
+                value = float(entry.get("value"))
+            except (AttributeError, TypeError, ValueError):
+                log.warning("Skipping malformed history entry: %r", entry)
+                continue
+            extra = {k: v for k, v in entry.items() if k not in ("timestamp", "value")}
+            series["ts"].append(ts)
+            series["val"].append(value)
+            series["extra"].append(extra or None)
+    else:
+        series["ts"].extend(data["ts"])
+        series["val"].extend(data["val"])
+        series["extra"] = list(data["extra"])
+    return series
+
+
+def _series_to_json(series: dict) -> dict:
+    return {
+        "ts": series["ts"].tolist(),
+        "val": series["val"].tolist(),
+        "extra": series["extra"],
+    }
+
+
+def _load_history() -> dict[str, dict]:
     try:
         if HISTORY_FILE.exists():
-            return json.loads(HISTORY_FILE.read_text())
+            raw = _json_loads(HISTORY_FILE.read_bytes())
+            return {svc: _series_from_json(data) for svc, data in raw.items()}
     except Exception as e:
         log.warning("Failed to load history: %s", e)
     return {}
 
 
 def _save_history():
+    """Write history to disk if samples were recorded since the last save."""
+    global _history_dirty
+    # Copy under the lock (array slices are plain memcpys), serialize outside
+    # it so readers aren't blocked for the duration of the encode.
     with _lock:
-        snapshot = json.dumps(_history, indent=2)
-    try:
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        HISTORY_FILE.write_text(snapshot)
-    except Exception as e:
-        log.warning("Failed to save history: %s", e)
+        if not _history_dirty:
+            return
+        _history_dirty = False
+        snapshot = {
+            svc: {"ts": s["ts"][:], "val": s["val"][:], "extra": list(s["extra"])}
+            for svc, s in _history.items()
+        }
+    body = _json_dumps(
+        {svc: _series_to_json(series) for svc, series in snapshot.items()},
+        indent=True,
+    )
+    _queue_write(HISTORY_FILE, body)
 
 
 def _prune_history():
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=HISTORY_MAX_DAYS)).isoformat() + "Z"
-    for svc in _history:
-        _history[svc] = [e for e in _history[svc] if e.get("timestamp", "") > cutoff]
-
-
-def _record_usage(service_id: str, value: float, extra: dict | None = None):
+    """Drop samples older than HISTORY_MAX_DAYS; run once per poll cycle."""
+    cutoff = time.time() - HISTORY_MAX_DAYS * 86400
+    with _lock:
+        for series in _history.values():
+            idx = bisect.bisect_right(series["ts"], cutoff)
+            if idx:
+                del series["ts"][:idx]
+                del series["val"][:idx]
+                del series["extra"][:idx]
+
+
+def _record_usage(service_id: str, value: float, extra: dict | None = None,
+                  ts: float | None = None):
+    # Only marks history dirty; the poller persists it once per cycle.
+    global _history_dirty
     with _lock:
         if service_id not in _history:
-            _history[service_id] = []
-        entry = {"timestamp": datetime.now(timezone.utc).isoformat() + "Z", "value": round(value, 1)}
-        if extra:
-            entry.update(extra)
-        _history[service_id].append(entry)
-        _prune_history()
-    _save_history()
+            _history[service_id] = _new_series()
+        series = _history[service_id]
+        if ts is None:
+            ts = time.time()
+        # Concurrent poll batches (or a clock step) can hand in an older
+        # timestamp; clamp it so "ts" stays sorted for the bisect lookups.
+        if series["ts"] and ts < series["ts"][-1]:
+            ts = series["ts"][-1]
+        series["ts"].append(ts)
+        series["val"].append(round(value, 1))
+        series["extra"].append(extra or None)
+        _history_dirty = True
 
 # ---------------------------------------------------------------------------
 # History query & analytics
 # ---------------------------------------------------------------------------
 
 def _get_history(service_id: str, period: str = "24h") -> list[dict]:
-    with _lock:
-        raw = _history.get(service_id, [])
-
     hours_map = {"24h": 24, "7d": 168, "28d": 672}
     hours = hours_map.get(period, 24)
-    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat() + "Z"
-    return [e for e in raw if e.get("timestamp", "") > cutoff]
+    cutoff = time.time() - hours * 3600
 
-
-def _calculate_velocity(service_id: str) -> dict | None:
     with _lock:
-        raw = _history.get(service_id, [])
-    if len(raw) < 2:
-        return None
-
-    cutoff = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat() + "Z"
-    recent = [e for e in raw if e.get("timestamp", "") > cutoff]
-    if len(recent) < 2:
-        recent = raw[-10:]
-    if len(recent) < 2:
-        return None
+        series = _history.get(service_id)
+        if not series:
+            return []
+        idx = bisect.bisect_right(series["ts"], cutoff)
+        ts = series["ts"][idx:]
+        val = series["val"][idx:]
+        extra = series["extra"][idx:]
+
+    result = []
+    for t, v, e in zip(ts, val, extra):
+        entry = {"timestamp": _format_timestamp(t), "value": v}
+        if e:
+            entry.update(e)
+        result.append(entry)
+    return result
 
-    first, last = recent[0], recent[-1]
-    try:
-        t0 = datetime.fromisoformat(first["timestamp"].rstrip("Z"))
-        t1 = datetime.fromisoformat(last["timestamp"].rstrip("Z"))
-    except (KeyError, ValueError):
-        return None
 
-    dt_hours = (t1 - t0).total_seconds() / 3600
+def _calculate_velocity(service_id: str) -> dict | None:
+    with _lock:
+        series = _history.get(service_id)
+        if not series or len(series["ts"]) < 2:
+            return None
+        ts, val = series["ts"], series["val"]
+        n = len(ts)
+        start = bisect.bisect_right(ts, time.time() - 3600)
+        if n - start < 2:
+            start = max(0, n - 10)
+        t0, t1 = ts[start], ts[-1]
+        first_value, current = val[start], val[-1]
+
+    dt_hours = (t1 - t0) / 3600
     if dt_hours <= 0:
         return None
 
-    vel = (last["value"] - first["value"]) / dt_hours
-    current = last["value"]
+    vel = (current - first_value) / dt_hours
 
     if vel <= 0:
         minutes_to_limit = -1
@@ -143,22 +382,40 @@ def _calculate_velocity(service_id: str) -> dict | None:
 # Service adapters
 # ---------------------------------------------------------------------------
 
-def _http_get(url: str, headers: dict | None = None, timeout: int = 15) -> tuple[int, str]:
-    req = Request(url, headers=headers or {})
-    req.add_header("User-Agent", "ApiDashboard/1.0")
+# Shared keep-alive pool: every poll hits the same few hosts, so reusing
+# connections skips the TCP + TLS handshake on all but the first request.
+_pool = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=4,
+    retries=urllib3.Retry(
+        total=HTTP_RETRIES, backoff_factor=0.2, respect_retry_after_header=False,
+    ),
+)
+
+
+def _http_get(url: str, headers: dict | None = None,
+              timeout: int = HTTP_READ_TIMEOUT) -> tuple[int, bytes]:
     try:
-        with urlopen(req, timeout=timeout) as resp:
-            return resp.status, resp.read().decode()
-    except HTTPError as e:
-        return e.code, e.read().decode() if hasattr(e, "read") else ""
-    except URLError as e:
-        raise ConnectionError(str(e.reason)) from e
+        resp = _pool.request(
+            "GET", url,
+            headers={**(headers or {}), "User-Agent": "ApiDashboard/1.0"},
+            # total caps each attempt, so a trickling response can't
+            # outlast the budget that POLL_TIMEOUT is derived from
+            timeout=urllib3.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT, read=timeout,
+                total=HTTP_CONNECT_TIMEOUT + timeout,
+            ),
+        )
+    except urllib3.exceptions.HTTPError as e:
+        reason = getattr(e, "reason", None) or e
+        raise ConnectionError(str(reason)) from e
+    return resp.status, resp.data
 
 
-def _fetch_firecrawl(cfg: dict) -> dict:
+def _fetch_firecrawl(cfg: dict, now: datetime) -> dict:
     api_key = _keyring_get("firecrawl")
     if not api_key:
-        return _error_result("firecrawl", "Firecrawl", "No API key configured")
+        return _error_result("firecrawl", "Firecrawl", "No API key configured", now)
 
     try:
         status, body = _http_get(
@@ -166,15 +423,15 @@ def _fetch_firecrawl(cfg: dict) -> dict:
             {"Authorization": f"Bearer {api_key}"}
         )
     except ConnectionError as e:
-        return _error_result("firecrawl", "Firecrawl", f"Connection failed: {e}")
+        return _error_result("firecrawl", "Firecrawl", f"Connection failed: {e}", now)
 
     if status == 401:
-        return _error_result("firecrawl", "Firecrawl", "Invalid API key")
+        return _error_result("firecrawl", "Firecrawl", "Invalid API key", now)
     if status != 200:
-        return _error_result("firecrawl", "Firecrawl", f"HTTP {status}")
+        return _error_result("firecrawl", "Firecrawl", f"HTTP {status}", now)
 
     try:
-        d = json.loads(body)
+        d = _json_loads(body)
         inner = d.get("data", d)
         total = inner.get("planCredits", 1)
         remaining = inner.get("remainingCredits", 0)
@@ -191,19 +448,19 @@ def _fetch_firecrawl(cfg: dict) -> dict:
             "total": total,
             "unit": "credits",
             "plan_name": f"{total:,} credits/mo",
-            "reset_info": _reset_countdown(reset_day),
+            "reset_info": _reset_countdown(reset_day, now),
             "details": {},
             "error": "",
-            "last_updated": datetime.now(timezone.utc).isoformat() + "Z",
+            "last_updated": _now_iso(now),
         }
     except (json.JSONDecodeError, KeyError) as e:
-        return _error_result("firecrawl", "Firecrawl", f"Parse error: {e}")
+        return _error_result("firecrawl", "Firecrawl", f"Parse error: {e}", now)
 
 
-def _fetch_serpapi(cfg: dict) -> dict:
+def _fetch_serpapi(cfg: dict, now: datetime) -> dict:
     api_key = _keyring_get("serpapi")
     if not api_key:
-        return _error_result("serpapi", "SerpAPI", "No API key configured")
+        return _error_result("serpapi", "SerpAPI", "No API key configured", now)
 
     try:
         from urllib.parse import quote
@@ -211,17 +468,17 @@ def _fetch_serpapi(cfg: dict) -> dict:
             f"https://serpapi.com/account.json?api_key={quote(api_key)}"
         )
     except ConnectionError as e:
-        return _error_result("serpapi", "SerpAPI", f"Connection failed: {e}")
+        return _error_result("serpapi", "SerpAPI", f"Connection failed: {e}", now)
     except Exception:
-        return _error_result("serpapi", "SerpAPI", "Request failed")
+        return _error_result("serpapi", "SerpAPI", "Request failed", now)
 
     if status != 200:
-        return _error_result("serpapi", "SerpAPI", f"HTTP {status}")
+        return _error_result("serpapi", "SerpAPI", f"HTTP {status}", now)
 
     try:
-        d = json.loads(body)
+        d = _json_loads(body)
         if d.get("error"):
-            return _error_result("serpapi", "SerpAPI", d["error"])
+            return _error_result("serpapi", "SerpAPI", d["error"], now)
 
         total = d.get("searches_per_month", 1)
         remaining = d.get("total_searches_left", d.get("plan_searches_left", 0))
@@ -238,16 +495,16 @@ def _fetch_serpapi(cfg: dict) -> dict:
             "total": total,
             "unit": "searches",
             "plan_name": d.get("plan_name", "Plan"),
-            "reset_info": _reset_countdown(reset_day),
+            "reset_info": _reset_countdown(reset_day, now),
             "details": {"hourly": d.get("last_hour_searches", 0)},
             "error": "",
-            "last_updated": datetime.now(timezone.utc).isoformat() + "Z",
+            "last_updated": _now_iso(now),
         }
     except (json.JSONDecodeError, KeyError) as e:
-        return _error_result("serpapi", "SerpAPI", f"Parse error: {e}")
+        return _error_result("serpapi", "SerpAPI", f"Parse error: {e}", now)
 
 
-def _fetch_claude(service_id: str, cfg: dict) -> dict:
+def _fetch_claude(service_id: str, cfg: dict, now: datetime) -> dict:
     label = cfg.get("label", service_id.replace("claude_", "").title())
     name = f"Claude ({label})"
     browser = cfg.get("browser", "chrome")
@@ -255,10 +512,10 @@ def _fetch_claude(service_id: str, cfg: dict) -> dict:
     try:
         cookies = _get_claude_cookies(browser, cfg.get("profile_path"))
     except Exception as e:
-        return _error_result(service_id, name, f"Cookie extraction failed: {e}")
+        return _error_result(service_id, name, f"Cookie extraction failed: {e}", now)
 
     if not cookies or "sessionKey" not in cookies:
-        return _error_result(service_id, name, "No session cookie found")
+        return _error_result(service_id, name, "No session cookie found", now)
 
     cookie_header = "; ".join(f"{k}={v}" for k, v in cookies.items())
     headers = {
@@ -272,28 +529,29 @@ def _fetch_claude(service_id: str, cfg: dict) -> dict:
     try:
         status, body = _http_get("https://claude.ai/api/organizations", headers)
     except ConnectionError as e:
-        return _error_result(service_id, name, f"Connection failed: {e}")
+        return _error_result(service_id, name, f"Connection failed: {e}", now)
 
     if status in (401, 403):
-        return _error_result(service_id, name, "Session expired")
+        # Re-read the browser's cookies next poll in case the user logged in again
+        _invalidate_claude_cookies(browser, cfg.get("profile_path"))
+        return _error_result(service_id, name, "Session expired", now)
     if status != 200:
-        return _error_result(service_id, name, f"HTTP {status} fetching orgs")
+        return _error_result(service_id, name, f"HTTP {status} fetching orgs", now)
 
     try:
-        orgs = json.loads(body)
-        if not orgs:
-            return _error_result(service_id, name, "No organizations found")
-        org = orgs[0]
+        org = _json_first_item(body)
+        if not org:
+            return _error_result(service_id, name, "No organizations found", now)
         org_id = org.get("uuid", "")
         org_name = org.get("name", "")
         plan_type = "free"
-        caps = org.get("capabilities", [])
-        if "max" in str(caps).lower():
+        caps = str(org.get("capabilities", [])).lower()
+        if "max" in caps:
             plan_type = "max"
-        elif "pro" in str(caps).lower():
+        elif "pro" in caps:
             plan_type = "pro"
-    except (json.JSONDecodeError, IndexError) as e:
-        return _error_result(service_id, name, f"Parse error (orgs): {e}")
+    except (ValueError, IndexError) as e:
+        return _error_result(service_id, name, f"Parse error (orgs): {e}", now)
 
     # Fetch usage
     try:
@@ -301,13 +559,13 @@ def _fetch_claude(service_id: str, cfg: dict) -> dict:
             f"https://claude.ai/api/organizations/{org_id}/usage", headers
         )
     except ConnectionError as e:
-        return _error_result(service_id, name, f"Connection failed: {e}")
+        return _error_result(service_id, name, f"Connection failed: {e}", now)
 
     if status != 200:
-        return _error_result(service_id, name, f"HTTP {status} fetching usage")
+        return _error_result(service_id, name, f"HTTP {status} fetching usage", now)
 
     try:
-        usage = json.loads(body)
+        usage = _json_loads(body)
         five_hour = usage.get("five_hour") or {}
         seven_day = usage.get("seven_day") or {}
         sonnet = usage.get("seven_day_sonnet") or {}
@@ -323,8 +581,8 @@ def _fetch_claude(service_id: str, cfg: dict) -> dict:
         sd_pct = _norm_pct(seven_day.get("utilization", 0))
         so_pct = _norm_pct(sonnet.get("utilization", 0))
 
-        fh_reset = _parse_reset_minutes(five_hour.get("resets_at"))
-        sd_reset = _parse_reset_minutes(seven_day.get("resets_at"))
+        fh_reset = _parse_reset_minutes(five_hour.get("resets_at"), now)
+        sd_reset = _parse_reset_minutes(seven_day.get("resets_at"), now)
 
         primary_pct = max(fh_pct, sd_pct)
 
@@ -347,16 +605,38 @@ def _fetch_claude(service_id: str, cfg: dict) -> dict:
                 "sonnet_usage": so_pct,
             },
             "error": "",
-            "last_updated": datetime.now(timezone.utc).isoformat() + "Z",
+            "last_updated": _now_iso(now),
         }
     except (json.JSONDecodeError, KeyError) as e:
-        return _error_result(service_id, name, f"Parse error (usage): {e}")
+        return _error_result(service_id, name, f"Parse error (usage): {e}", now)
 
 # ---------------------------------------------------------------------------
 # Claude cookie extraction
 # ---------------------------------------------------------------------------
 
 def _get_claude_cookies(browser: str, profile_path: str | None = None) -> dict:
+    # Reading the cookie DB means opening and decrypting it, so reuse the
+    # result for a short while; Claude session cookies live for hours.
+    key = (browser, profile_path)
+    with _lock:
+        cached = _cookie_cache.get(key)
+    if cached and (time.time() - cached[0]) < COOKIE_CACHE_TTL:
+        return cached[1]
+    cookies = _read_claude_cookies(browser, profile_path)
+    # Only cache a usable session, so logging in to claude.ai after a miss is
+    # picked up on the next poll rather than after COOKIE_CACHE_TTL.
+    if "sessionKey" in cookies:
+        with _lock:
+            _cookie_cache[key] = (time.time(), cookies)
+    return cookies
+
+
+def _invalidate_claude_cookies(browser: str, profile_path: str | None = None):
+    with _lock:
+        _cookie_cache.pop((browser, profile_path), None)
+
+
+def _read_claude_cookies(browser: str, profile_path: str | None = None) -> dict:
     try:
         import browser_cookie3
     except ImportError:
@@ -390,14 +670,23 @@ def _get_claude_cookies(browser: str, profile_path: str | None = None) -> dict:
 # ---------------------------------------------------------------------------
 
 def _keyring_get(key: str) -> str:
+    # Only successful lookups are memoized: an empty result may just mean the
+    # key hasn't been stored yet or the keyring is still locked.
+    cached = _keyring_cache.get(key)
+    if cached:
+        return cached
     try:
         import keyring
-        return keyring.get_password("api-dashboard", key) or ""
+        value = keyring.get_password("api-dashboard", key) or ""
     except Exception:
         return ""
+    if value:
+        _keyring_cache[key] = value
+    return value
 
 
-def _error_result(service_id: str, name: str, error: str) -> dict:
+def _error_result(service_id: str, name: str, error: str,
+                  now: datetime | None = None) -> dict:
     return {
         "id": service_id,
         "name": name,
@@ -410,12 +699,11 @@ def _error_result(service_id: str, name: str, error: str) -> dict:
         "reset_info": "",
         "details": {},
         "error": error,
-        "last_updated": datetime.now(timezone.utc).isoformat() + "Z",
+        "last_updated": _now_iso(now),
     }
 
 
-def _reset_countdown(day: int) -> str:
-    now = datetime.now(timezone.utc)
+def _reset_countdown(day: int, now: datetime) -> str:
     reset = now.replace(day=min(day, 28))
     if reset <= now:
         if now.month == 12:
@@ -428,12 +716,18 @@ def _reset_countdown(day: int) -> str:
     return f"{days}d {hours}h"
 
 
-def _parse_reset_minutes(resets_at: str | None) -> int:
+@functools.lru_cache(maxsize=32)
+def _parse_reset_time(resets_at: str) -> datetime:
+    # Reset times only change once per window, so most polls repeat a string
+    return datetime.fromisoformat(resets_at.rstrip("Z"))
+
+
+def _parse_reset_minutes(resets_at: str | None, now: datetime) -> int:
     if not resets_at:
         return 0
     try:
-        reset_time = datetime.fromisoformat(resets_at.rstrip("Z"))
-        delta = reset_time - datetime.now(timezone.utc)
+        reset_time = _parse_reset_time(resets_at)
+        delta = reset_time - now
         return max(0, int(delta.total_seconds() / 60))
     except (ValueError, TypeError):
         return 0
@@ -451,102 +745,211 @@ def _format_minutes(minutes: int) -> str:
 # ---------------------------------------------------------------------------
 # Adapter dispatch
 # ---------------------------------------------------------------------------
+# service_id -> adapter(cfg, now) returning a usage result dict
 ADAPTERS = {
     "firecrawl": _fetch_firecrawl,
     "serpapi": _fetch_serpapi,
-    "claude_work": lambda cfg: _fetch_claude("claude_work", cfg),
-    "claude_private": lambda cfg: _fetch_claude("claude_private", cfg),
+    "claude_work": lambda cfg, now: _fetch_claude("claude_work", cfg, now),
+    "claude_private": lambda cfg, now: _fetch_claude("claude_private", cfg, now),
 }
 
 
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="poll")
+
+
 def _poll_all():
-    """Poll all enabled services."""
-    with _lock:
-        services = dict(_config.get("services", {}))
-    for svc_id, cfg in services.items():
-        if not cfg.get("enabled", False):
+    """Poll all enabled services concurrently."""
+    _poll_services(list(_service_configs()))
+
+
+def _poll_services(service_ids: list[str]):
+    """Poll the given services concurrently, skipping disabled ones."""
+    services = _service_configs()
+    now = datetime.now(timezone.utc)
+
+    futures = {}
+    for svc_id in service_ids:
+        cfg = services.get(svc_id)
+        if not cfg or not cfg.get("enabled", False):
             continue
         adapter = ADAPTERS.get(svc_id)
         if not adapter:
             continue
-        try:
-            result = adapter(cfg)
-            with _lock:
-                _usage_cache[svc_id] = {"data": result, "timestamp": time.time()}
-            if not result.get("error"):
-                _record_usage(svc_id, result["percentage"], result.get("details"))
-        except Exception as e:
-            log.error("Error polling %s: %s", svc_id, e)
-            with _lock:
-                _usage_cache[svc_id] = {
-                    "data": _error_result(svc_id, svc_id, str(e)),
-                    "timestamp": time.time(),
-                }
+        futures[_executor.submit(adapter, cfg, now)] = svc_id
+
+    updates: dict[str, dict] = {}
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=POLL_TIMEOUT):
+            svc_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                log.error("Error polling %s: %s", svc_id, e)
+                result = _error_result(svc_id, svc_id, str(e), now)
+            updates[svc_id] = result
+    except concurrent.futures.TimeoutError:
+        pending = sorted(svc_id for f, svc_id in futures.items() if not f.done())
+        log.error("Timed out polling %s", ", ".join(pending))
+        # Don't leave the previous result published as if it were current
+        for svc_id in pending:
+            updates[svc_id] = _error_result(svc_id, svc_id, "Timed out", now)
+
+    polled_at = time.time()
+    _publish_usage({
+        svc_id: {"data": result, "timestamp": polled_at}
+        for svc_id, result in updates.items()
+    })
+    for svc_id, result in updates.items():
+        if not result.get("error"):
+            _record_usage(svc_id, result["percentage"], result.get("details"), polled_at)
 
 # ---------------------------------------------------------------------------
 # Background poller
 # ---------------------------------------------------------------------------
 
+def _coerce_interval(value) -> float | None:
+    """Return value as a positive number of seconds, or None if invalid."""
+    try:
+        interval = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(interval) or interval <= 0:
+        return None
+    return interval
+
+
+def _refresh_interval() -> float:
+    interval = _coerce_interval(_config.get("refresh_interval")) or 300.0
+    return max(interval, MIN_POLL_INTERVAL)
+
+
+def _poll_interval(svc_id: str, cfg: dict) -> float:
+    """Seconds until svc_id is next polled."""
+    interval = _coerce_interval(cfg.get("interval"))
+    if interval is None:
+        return max(_refresh_interval(), SERVICE_MIN_INTERVALS.get(svc_id, 0))
+    return max(interval, MIN_POLL_INTERVAL)
+
+
 class Poller(threading.Thread):
     def __init__(self):
         super().__init__(daemon=True)
         self._stop_event = threading.Event()
 
     def run(self):
+        # Min-heap of (due, service_id) on the monotonic clock. Each service
+        # is rescheduled by _poll_interval(); services that fall due together
+        # are polled as one concurrent batch.
+        heap: list[tuple[float, str]] = []
+        scheduled: set[str] = set()
         while not self._stop_event.is_set():
+            # Clear before reading _config: a push landing after this point
+            # sets the event again and cuts the wait below short.
+            _poll_wakeup.clear()
+            now = time.monotonic()
+            try:
+                for svc_id, cfg in _service_configs().items():
+                    if svc_id not in scheduled and cfg.get("enabled", False) and svc_id in ADAPTERS:
+                        heapq.heappush(heap, (now, svc_id))
+                        scheduled.add(svc_id)
+            except Exception as e:
+                log.error("Poller error: %s", e)
+
+            timeout = max(0.0, heap[0][0] - now) if heap else _refresh_interval()
+            if self._sleep(timeout):
+                break
+
+            due = []
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap)[1])
+            if not due:
+                continue  # woken early by a config change
             try:
-                _poll_all()
+                _poll_services(due)
+                _prune_history()
+                _save_history()
             except Exception as e:
                 log.error("Poller error: %s", e)
-            with _lock:
-                interval = _config.get("refresh_interval", 300)
-            self._stop_event.wait(interval)
+
+            services = _service_configs()
+            now = time.monotonic()
+            for svc_id in due:
+                try:
+                    cfg = services.get(svc_id)
+                    if not cfg or not cfg.get("enabled", False):
+                        scheduled.discard(svc_id)  # picked up again if re-enabled
+                        continue
+                    interval = _poll_interval(svc_id, cfg)
+                except Exception as e:
+                    log.error("Error rescheduling %s: %s", svc_id, e)
+                    interval = _refresh_interval()
+                heapq.heappush(heap, (now + interval, svc_id))
+
+    def _sleep(self, timeout: float) -> bool:
+        """Wait until timeout, a config change or stop(); True if stopping."""
+        _poll_wakeup.wait(timeout)
+        return self._stop_event.is_set()
 
     def stop(self):
         self._stop_event.set()
+        _poll_wakeup.set()
 
 # ---------------------------------------------------------------------------
 # HTTP handler
 # ---------------------------------------------------------------------------
 
 class Handler(BaseHTTPRequestHandler):
+    # Routes are matched against the path with any trailing slash removed:
+    # exact paths by dict lookup, then "/<prefix>/{svc_id}" routes whose
+    # handler receives the service id.
+    _ROUTES = {
+        "/health": "_handle_health",
+        "/usage": "_handle_usage_all",
+    }
+    _SERVICE_ROUTES = (
+        ("/usage/", "_handle_usage"),
+        ("/history/", "_handle_history"),
+        ("/velocity/", "_handle_velocity"),
+    )
+
     def log_message(self, format, *args):
         log.debug(format, *args)
 
     def _send_json(self, data, status_code=200):
-        body = json.dumps(data).encode()
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        body = _json_dumps(data)
+        self.log_request(status_code)
+        # Status line, headers and body go out in a single write rather than
+        # one small write for the headers followed by another for the body.
+        head = (
+            b"%s %d %s\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: %d\r\n"
+            b"\r\n"
+        ) % (
+            self.protocol_version.encode(),
+            status_code,
+            self.responses[status_code][0].encode(),
+            len(body),
+        )
+        self.wfile.write(head + body)
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path.rstrip("/")
-        qs = parse_qs(parsed.query)
-
-        if path == "/health":
-            self._send_json({"status": "ok"})
+        path, _, self.query = self.path.partition("?")
+        path = path.rstrip("/")
 
-        elif path == "/usage":
-            self._handle_usage_all()
-
-        elif path.startswith("/usage/"):
-            svc_id = path.split("/usage/", 1)[1]
-            self._handle_usage(svc_id)
-
-        elif path.startswith("/history/"):
-            svc_id = path.split("/history/", 1)[1]
-            period = qs.get("period", ["24h"])[0]
-            self._handle_history(svc_id, period)
-
-        elif path.startswith("/velocity/"):
-            svc_id = path.split("/velocity/", 1)[1]
-            self._handle_velocity(svc_id)
-
-        else:
-            self._send_json({"error": "Not found"}, 404)
+        name = self._ROUTES.get(path)
+        if name:
+            getattr(self, name)()
+            return
+        for prefix, name in self._SERVICE_ROUTES:
+            if path.startswith(prefix):
+                svc_id = path.removeprefix(prefix)
+                if svc_id and "/" not in svc_id:
+                    getattr(self, name)(svc_id)
+                    return
+                break
+        self._send_json({"error": "Not found"}, 404)
 
     def do_POST(self):
         parsed = urlparse(self.path)
@@ -560,33 +963,34 @@ class Handler(BaseHTTPRequestHandler):
         else:
             self._send_json({"error": "Not found"}, 404)
 
+    def _handle_health(self):
+        self._send_json({"status": "ok"})
+
     def _handle_usage_all(self):
         services = []
-        with _lock:
-            for svc_id in _config.get("services", {}):
-                if not _config["services"][svc_id].get("enabled", False):
-                    continue
-                cached = _usage_cache.get(svc_id)
-                if cached:
-                    services.append(cached["data"])
-                else:
-                    services.append(_error_result(svc_id, svc_id, "Not yet polled"))
+        snap = _usage_snapshot
+        for svc_id, cfg in _service_configs().items():
+            if not cfg.get("enabled", False):
+                continue
+            cached = snap.get(svc_id)
+            if cached:
+                services.append(cached["data"])
+            else:
+                services.append(_error_result(svc_id, svc_id, "Not yet polled"))
         self._send_json({"services": services})
 
     def _handle_usage(self, svc_id: str):
-        with _lock:
-            cached = _usage_cache.get(svc_id)
+        cached = _usage_snapshot.get(svc_id)
         if cached and (time.time() - cached["timestamp"]) < CACHE_TTL:
             self._send_json(cached["data"])
         else:
-            cfg = _config.get("services", {}).get(svc_id, {})
+            cfg = _service_configs().get(svc_id, {})
             adapter = ADAPTERS.get(svc_id)
             if not adapter:
                 self._send_json({"error": f"Unknown service: {svc_id}"}, 404)
                 return
-            result = adapter(cfg)
-            with _lock:
-                _usage_cache[svc_id] = {"data": result, "timestamp": time.time()}
+            result = adapter(cfg, datetime.now(timezone.utc))
+            _publish_usage({svc_id: {"data": result, "timestamp": time.time()}})
             if not result.get("error"):
                 threading.Thread(
                     target=_record_usage,
@@ -595,7 +999,8 @@ class Handler(BaseHTTPRequestHandler):
                 ).start()
             self._send_json(result)
 
-    def _handle_history(self, svc_id: str, period: str):
+    def _handle_history(self, svc_id: str):
+        period = parse_qs(self.query).get("period", ["24h"])[0]
         data = _get_history(svc_id, period)
         self._send_json({
             "service_id": svc_id,
@@ -620,28 +1025,29 @@ class Handler(BaseHTTPRequestHandler):
             if length > MAX_CONFIG_SIZE:
                 self._send_json({"error": "Payload too large"}, 413)
                 return
-            body = self.rfile.read(length).decode()
-            new_config = json.loads(body)
+            body = self.rfile.read(length)
+            new_config = _json_loads(body)
         except (ValueError, json.JSONDecodeError) as e:
             self._send_json({"error": f"Invalid JSON: {e}"}, 400)
             return
 
-        global _config
-        with _lock:
-            _config.update(new_config)
-            # Strip sensitive keys before persisting
-            safe_config = json.loads(json.dumps(_config))
-            for svc in safe_config.get("services", {}).values():
-                svc.pop("api_key", None)
-            config_snapshot = json.dumps(safe_config, indent=2)
+        config = _publish_config(new_config)
+        # Strip sensitive keys before persisting
+        safe_config = {
+            **config,
+            "services": {
+                svc_id: {k: v for k, v in svc.items() if k != "api_key"}
+                for svc_id, svc in config.get("services", {}).items()
+            },
+        }
+        config_snapshot = _json_dumps(safe_config, indent=True)
+        # Keys may have been changed alongside the config push
+        _keyring_cache.clear()
+        # Let the poller pick up newly enabled services straight away
+        _poll_wakeup.set()
 
         # Persist config with restricted permissions
-        try:
-            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            CONFIG_FILE.write_text(config_snapshot)
-            CONFIG_FILE.chmod(0o600)
-        except Exception as e:
-            log.warning("Failed to persist config: %s", e)
+        _queue_write(CONFIG_FILE, config_snapshot, 0o600)
 
         self._send_json({"status": "ok"})
 
@@ -658,25 +1064,29 @@ def run_server(port: int = 19853):
     # Load persisted config
     if CONFIG_FILE.exists():
         try:
-            loaded = json.loads(CONFIG_FILE.read_text())
-            with _lock:
-                _config.update(loaded)
+            loaded = _json_loads(CONFIG_FILE.read_bytes())
+            _publish_config(loaded)
             # Ensure restrictive permissions on existing config
             CONFIG_FILE.chmod(0o600)
             log.info("Loaded config from %s", CONFIG_FILE)
         except Exception as e:
             log.warning("Failed to load config: %s", e)
 
-    server = HTTPServer(("127.0.0.1", port), Handler)
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
     log.info("API Dashboard daemon listening on 127.0.0.1:%d", port)
 
+    writer = Writer()
+    writer.start()
     poller = Poller()
     poller.start()
 
     def shutdown(signum, frame):
         log.info("Shutting down...")
         poller.stop()
-        server.shutdown()
+        # shutdown() blocks until serve_forever() returns, and the signal
+        # handler runs on the thread inside serve_forever(), so hand it off.
+        threading.Thread(target=server.shutdown, daemon=True).start()
 
     signal.signal(signal.SIGTERM, shutdown)
     signal.signal(signal.SIGINT, shutdown)
@@ -688,6 +1098,8 @@ def run_server(port: int = 19853):
     finally:
         poller.stop()
         server.server_close()
+        _save_history()
+        writer.stop()
 
 
 def main():